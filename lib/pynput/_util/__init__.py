@@ -101,6 +101,12 @@ def prefix(base, cls):
                 return result
 
 
+def _noop(*_args):
+    """A callback doing nothing, used for callbacks not passed to a listener.
+    """
+    pass
+
+
 class AbstractListener(threading.Thread):
     """A class implementing the basic behaviour for event listeners.
 
@@ -157,8 +163,10 @@ class AbstractListener(threading.Thread):
 
         self.daemon = True
 
+        # Callbacks not passed are set to a function doing nothing; it never
+        # returns False, so there is no need to wrap it
         for name, callback in kwargs.items():
-            setattr(self, name, wrapper(callback or (lambda *a: None)))
+            setattr(self, name, wrapper(callback) if callback else _noop)
 
     @property
     def suppress(self):
@@ -292,19 +300,43 @@ class Events(object):
     _Listener = None
 
     class Event(object):
+        # Subclasses may use __slots__ for their fields
+        __slots__ = tuple()
+
         def __str__(self):
             return '{}({})'.format(
                 self.__class__.__name__,
                 ', '.join(
                     '{}={}'.format(k, v)
-                    for (k, v) in vars(self).items()))
+                    for (k, v) in self._fields()))
+
+        def _fields(self):
+            """The names and values of the fields of this event.
+
+            :return: a sequence of ``(name, value)`` tuples
+            """
+            # Slots are declared per class, and an unslotted subclass adds a
+            # __dict__ without removing the slots of its bases
+            result = []
+            for cls in reversed(type(self).__mro__):
+                slots = cls.__dict__.get('__slots__', tuple())
+                if isinstance(slots, six.string_types):
+                    slots = (slots,)
+                result.extend(
+                    (k, getattr(self, k))
+                    for k in slots
+                    if k not in ('__dict__', '__weakref__')
+                    and hasattr(self, k))
+            if hasattr(self, '__dict__'):
+                result.extend(vars(self).items())
+            return result
 
         def __eq__(self, other):
             return self.__class__ == other.__class__ \
-                and dir(self) == dir(other) \
-                and all(
-                    getattr(self, k) == getattr(other, k)
-                    for k in dir(self))
+                and dict(self._fields()) == dict(other._fields())
+
+        def __ne__(self, other):
+            return not self == other
 
     def __init__(self, *args, **kwargs):
         super(Events, self).__init__()
@@ -390,8 +422,12 @@ class NotifierMixin(object):
 
         :param args: The arguments to pass.
         """
+        listeners = self._listeners()
+        if not listeners:
+            return
+
         stopped = []
-        for listener in self._listeners():
+        for listener in listeners:
             try:
                 getattr(listener, action)(*args)
             except listener.StopException:
@@ -427,24 +463,24 @@ class NotifierMixin(object):
         # Make sure this class has the necessary attributes
         if not hasattr(cls, '_listener_cache'):
             cls._listener_cache = set()
+            cls._listener_snapshot = tuple()
             cls._listener_lock = threading.Lock()
 
         return listener_class
 
     @classmethod
     def _listeners(cls):
-        """Iterates over the set of running listeners.
+        """The running listeners.
 
-        This method will quit without acquiring the lock if the set is empty,
-        so there is potential for race conditions. This is an optimisation,
-        since :class:`Controller` will need to call this method for every
-        control event.
+        This method returns an immutable snapshot that is replaced whenever a
+        listener is added or removed, so no lock is acquired. This is an
+        optimisation, since :class:`Controller` will need to call this method
+        for every control event. It also means that listeners may stop
+        themselves, or start other listeners, while being notified.
+
+        :return: a tuple of listeners
         """
-        if not cls._listener_cache:
-            return
-        with cls._listener_lock:
-            for listener in cls._listener_cache:
-                yield listener
+        return cls._listener_snapshot
 
     @classmethod
     def _add_listener(cls, listener):
@@ -454,6 +490,7 @@ class NotifierMixin(object):
         """
         with cls._listener_lock:
             cls._listener_cache.add(listener)
+            cls._listener_snapshot = tuple(cls._listener_cache)
 
     @classmethod
     def _remove_listener(cls, listener):
@@ -463,3 +500,4 @@ class NotifierMixin(object):
         """
         with cls._listener_lock:
             cls._listener_cache.remove(listener)
+            cls._listener_snapshot = tuple(cls._listener_cache)
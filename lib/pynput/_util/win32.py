@@ -134,6 +134,7 @@ SendInput.argtypes = (
     wintypes.UINT,
     ctypes.c_voidp,  # Really LPINPUT
     ctypes.c_int)
+SendInput.restype = wintypes.UINT
 
 GetCurrentThreadId = windll.kernel32.GetCurrentThreadId
 GetCurrentThreadId.restype = wintypes.DWORD
@@ -21,13 +21,15 @@ Utility functions and classes for the *Xorg* backend.
 # pylint: disable=R0903
 # We implement stubs
 
+import collections
 import contextlib
 import functools
-import itertools
 import operator
+import struct
 import Xlib.display
 import Xlib.keysymdef
 import Xlib.threaded
+import Xlib.X
 import Xlib.XK
 
 from . import AbstractListener
@@ -148,6 +150,19 @@ def numlock_mask(display):
     return display.__numlock_mask
 
 
+def clear_masks(display):
+    """Clears the cached modifier mask flags for a display.
+
+    This must be called when the modifier mapping or keyboard mapping changes,
+    since the masks are calculated from these.
+
+    :param Xlib.display.Display display: The *X* display.
+    """
+    for name in ('__alt_mask', '__altgr_mask', '__numlock_mask'):
+        if name in display.__dict__:
+            delattr(display, name)
+
+
 def keysym_is_latin_upper(keysym):
     """Determines whether a *keysym* is an upper case *latin* character.
 
@@ -228,10 +243,10 @@ def keysym_normalize(keysym):
     :return: the tuple ``(group_1, group_2)`` or ``None``
     """
     # Remove trailing NoSymbol
-    stripped = list(reversed(list(
-        itertools.dropwhile(
-            lambda n: n == Xlib.XK.NoSymbol,
-            reversed(keysym)))))
+    end = len(keysym)
+    while end and keysym[end - 1] == Xlib.XK.NoSymbol:
+        end -= 1
+    stripped = keysym[:end]
 
     if not stripped:
         return
@@ -308,29 +323,31 @@ def keyboard_mapping(display):
     shift_mask = 1 << 0
     group_mask = alt_gr_mask(display)
 
+    # The shift states for the keysyms in the normalised groups, in the order
+    # returned by keysym_normalize
+    shift_states = (
+        (0, shift_mask),
+        (group_mask, group_mask | shift_mask))
+
     # Iterate over all keysym lists in the keyboard mapping
     min_keycode = display.display.info.min_keycode
     keycode_count = display.display.info.max_keycode - min_keycode + 1
-    for index, keysyms in enumerate(display.get_keyboard_mapping(
-            min_keycode, keycode_count)):
-        key_code = index + min_keycode
-
+    for key_code, keysyms in enumerate(display.get_keyboard_mapping(
+            min_keycode, keycode_count), min_keycode):
         # Normalise the keysym list to yield a tuple containing the two groups
         normalized = keysym_normalize(keysyms)
         if not normalized:
             continue
 
         # Iterate over the groups to extract the shift and modifier state
-        for groups, group in zip(normalized, (False, True)):
-            for keysym, shift in zip(groups, (False, True)):
+        for groups, states in zip(normalized, shift_states):
+            for keysym, shift_state in zip(groups, states):
                 if not keysym:
                     continue
-                shift_state = 0 \
-                    | (shift_mask if shift else 0) \
-                    | (group_mask if group else 0)
 
                 # Prefer already known lesser shift states
-                if keysym in mapping and mapping[keysym][1] < shift_state:
+                previous = mapping.get(keysym)
+                if previous is not None and previous[1] < shift_state:
                     continue
                 mapping[keysym] = (key_code, shift_state)
 
@@ -366,6 +383,29 @@ def symbol_to_keysym(symbol):
         or SYMBOLS.get(symbol, (0,))[0])
 
 
+#: A light weight representation of the core input events, ``KeyPress``,
+#: ``KeyRelease``, ``ButtonPress``, ``ButtonRelease`` and ``MotionNotify``;
+#: the field names are those of the corresponding *Xlib* event classes, but
+#: ``root``, ``window`` and ``child`` are plain resource IDs
+InputEvent = collections.namedtuple(
+    'InputEvent',
+    (
+        'type',
+        'detail',
+        'sequence_number',
+        'time',
+        'root',
+        'window',
+        'child',
+        'root_x',
+        'root_y',
+        'event_x',
+        'event_y',
+        'state',
+        'same_screen',
+        'send_event'))
+
+
 class ListenerMixin(object):
     """A mixin for *X* event listeners.
 
@@ -378,6 +418,22 @@ class ListenerMixin(object):
     #: We use this instance for parsing the binary data
     _EVENT_PARSER = Xlib.protocol.rq.EventField(None)
 
+    #: The binary layout of the core input events; this is the layout used by
+    #: *Xlib* for these events
+    _INPUT_EVENT = struct.Struct('=BBHLLLLhhhhHB1x')
+
+    #: The event types that are parsed using :attr:`_INPUT_EVENT`
+    _INPUT_EVENT_TYPES = frozenset((
+        Xlib.X.KeyPress,
+        Xlib.X.KeyRelease,
+        Xlib.X.ButtonPress,
+        Xlib.X.ButtonRelease,
+        Xlib.X.MotionNotify))
+
+    #: The event types that are coalesced; of a run of consecutive events of
+    #: such a type delivered in one batch, only the last one is handled
+    _coalesced_events = frozenset()
+
     def _run(self):
         self._display_stop = Xlib.display.Display()
         self._display_record = Xlib.display.Display()
@@ -456,18 +512,66 @@ class ListenerMixin(object):
         This method will parse the response and call the callbacks registered
         on initialisation.
 
+        Core input events are unpacked directly into :class:`InputEvent`
+        instances, since the generic *Xlib* parser is slow; any other event is
+        passed to :attr:`_EVENT_PARSER`.
+
+        Events with a type in :attr:`_coalesced_events` are held back until an
+        event of another type arrives, or the batch ends, and only the last
+        one is handled.
+
         :param events: The events passed by *X*. This is a binary block
             parsable by :attr:`_EVENT_PARSER`.
         """
         if not self.running:
             raise self.StopException()
 
-        data = events.data
-
-        while data and len(data):
-            event, data = self._EVENT_PARSER.parse_binary_value(
-                data, self._display_record.display, None, None)
-            self._handle(self._display_stop, event)
+        data = events.data or b''
+        offset = 0
+        pending = None
+
+        # Bind the names used for every event in the batch
+        display = self._display_stop
+        handle = self._handle
+        unpack_from = self._INPUT_EVENT.unpack_from
+        size = self._INPUT_EVENT.size
+        input_event_types = self._INPUT_EVENT_TYPES
+        coalesced_events = self._coalesced_events
+
+        if data:
+            self._handle_batch(display)
+
+        while offset < len(data):
+            if len(data) - offset >= size:
+                fields = unpack_from(data, offset)
+                event_type = fields[0] & 0x7f
+            else:
+                event_type = None
+
+            if event_type in input_event_types:
+                event = InputEvent(
+                    event_type,
+                    *fields[1:],
+                    send_event=bool(fields[0] & 0x80))
+                offset += size
+            else:
+                event, data = self._EVENT_PARSER.parse_binary_value(
+                    data[offset:], self._display_record.display, None, None)
+                offset = 0
+
+            if event.type in coalesced_events:
+                if pending is not None and pending.type != event.type:
+                    handle(display, pending)
+                pending = event
+                continue
+
+            if pending is not None:
+                handle(display, pending)
+                pending = None
+            handle(display, event)
+
+        if pending is not None:
+            handle(display, pending)
 
     def _initialize(self, display):
         """Initialises this listener.
@@ -479,6 +583,14 @@ class ListenerMixin(object):
         """
         pass
 
+    def _handle_batch(self, display):
+        """Called once for every batch of recorded events, before any of
+        them is passed to :meth:`_handle`.
+
+        :param display: The display being used.
+        """
+        pass
+
     def _handle(self, display, event):
         """The device specific callback handler.
 
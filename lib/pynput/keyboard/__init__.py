@@ -79,6 +79,8 @@ class Events(Events):
     class Press(Events.Event):
         """A key press event.
         """
+        __slots__ = ('key',)
+
         def __init__(self, key):
             #: The key.
             self.key = key
@@ -86,6 +88,8 @@ class Events(Events):
     class Release(Events.Event):
         """A key release event.
         """
+        __slots__ = ('key',)
+
         def __init__(self, key):
             #: The key.
             self.key = key
@@ -43,6 +43,10 @@ class KeyCode(object):
     #: The names of attributes used as platform extensions.
     _PLATFORM_EXTENSIONS = []
 
+    # __dict__ is kept so that users may still set their own attributes
+    __slots__ = (
+        'vk', 'char', 'is_dead', 'combining', '__dict__', '__weakref__')
+
     def __init__(self, vk=None, char=None, is_dead=False, **kwargs):
         self.vk = vk
         self.char = six.text_type(char) if char is not None else None
@@ -90,6 +94,20 @@ class KeyCode(object):
     def __hash__(self):
         return hash(repr(self))
 
+    def __getstate__(self):
+        # Pickle protocols before 2 do not read slots
+        state = dict(vars(self))
+        state.update(
+            (k, getattr(self, k))
+            for cls in type(self).__mro__
+            for k in cls.__dict__.get('__slots__', tuple())
+            if k not in ('__dict__', '__weakref__') and hasattr(self, k))
+        return state
+
+    def __setstate__(self, state):
+        for (k, v) in state.items():
+            setattr(self, k, v)
+
     def join(self, key):
         """Applies this dead key to another key and returns the result.
 
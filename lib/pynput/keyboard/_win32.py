@@ -47,6 +47,14 @@ from pynput._util.win32 import (
 from . import _base
 
 
+#: The size of an INPUT structure, as passed to SendInput
+_INPUT_SIZE = ctypes.sizeof(INPUT)
+
+#: A cache of key codes for UTF-16 characters received by the listener, keyed
+#: by the character code
+_UTF16_KEYS = {}
+
+
 class KeyCode(_base.KeyCode):
     _PLATFORM_EXTENSIONS = (
         # Any extra flags.
@@ -56,18 +64,17 @@ class KeyCode(_base.KeyCode):
         '_scan',
     )
 
-    # Be explicit about fields
-    _flags = None
-    _scan = None
+    __slots__ = _PLATFORM_EXTENSIONS
 
     def _parameters(self, is_press):
         """The parameters to pass to ``SendInput`` to generate this key.
 
         :param bool is_press: Whether to generate a press event.
 
-        :return: all arguments to pass to ``SendInput`` for this key
+        :return: the tuple ``(wVk, wScan, dwFlags)``, in the order of the
+            fields of ``KEYBDINPUT``
 
-        :rtype: dict
+        :rtype: tuple
 
         :raise ValueError: if this key is a unicode character that cannot be
         represented by a single UTF-16 value
@@ -91,10 +98,7 @@ class KeyCode(_base.KeyCode):
                 scan = ord(self.char)
                 flags = KEYBDINPUT.UNICODE
         state_flags = (KEYBDINPUT.KEYUP if not is_press else 0)
-        return dict(
-            dwFlags=(self._flags or 0) | flags | state_flags,
-            wVk=vk,
-            wScan=scan)
+        return (vk, scan, (self._flags or 0) | flags | state_flags)
 
     @classmethod
     def _from_ext(cls, vk, **kwargs):
@@ -194,8 +198,8 @@ class Controller(_base.Controller):
                 ctypes.byref(INPUT(
                     type=INPUT.KEYBOARD,
                     value=INPUT_union(
-                        ki=KEYBDINPUT(**key._parameters(is_press))))),
-                ctypes.sizeof(INPUT))
+                        ki=KEYBDINPUT(*key._parameters(is_press))))),
+                _INPUT_SIZE)
         except ValueError:
             # If key._parameters raises ValueError, the key is a unicode
             # characters outsice of the range of a single UTF-16 value, and we
@@ -218,7 +222,7 @@ class Controller(_base.Controller):
                                 dwFlags=state_flags,
                                 wScan=scan)))
                     for scan in surrogates)),
-                ctypes.sizeof(INPUT))
+                _INPUT_SIZE)
 
 
 class Listener(ListenerMixin, _base.Listener):
@@ -276,7 +280,7 @@ class Listener(ListenerMixin, _base.Listener):
         self._translator = KeyTranslator()
         self._event_filter = self._options.get(
             'event_filter',
-            lambda msg, data: True)
+            None)
 
     def _convert(self, code, msg, lpdata):
         if code != SystemHook.HC_ACTION:
@@ -286,7 +290,8 @@ class Listener(ListenerMixin, _base.Listener):
         is_packet = data.vkCode == self._VK_PACKET
 
         # Suppress further propagation of the event if it is filtered
-        if self._event_filter(msg, data) is False:
+        if self._event_filter is not None \
+                and self._event_filter(msg, data) is False:
             return None
         elif is_packet:
             return (msg | self._UTF16_FLAG, data.scanCode)
@@ -305,7 +310,10 @@ class Listener(ListenerMixin, _base.Listener):
         if is_utf16:
             msg = msg ^ self._UTF16_FLAG
             scan = vk
-            key = KeyCode.from_char(six.unichr(scan))
+            key = _UTF16_KEYS.get(scan)
+            if key is None:
+                key = _UTF16_KEYS.setdefault(
+                    scan, KeyCode.from_char(six.unichr(scan)))
         else:
             try:
                 key = self._event_to_key(msg, vk)
@@ -367,9 +375,8 @@ class Listener(ListenerMixin, _base.Listener):
     def canonical(self, key):
         # If the key has a scan code, and we can find the character for it,
         # return that, otherwise call the super class
-        scan = getattr(key, '_scan', None)
-        if scan is not None:
-            char = self._translator.char_from_scan(scan)
+        if isinstance(key, KeyCode) and key._scan is not None:
+            char = self._translator.char_from_scan(key._scan)
             if char is not None:
                 return KeyCode.from_char(char)
 
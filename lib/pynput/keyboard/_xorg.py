@@ -31,6 +31,8 @@ except Exception as e:
     raise ImportError('failed to acquire X connection: {}'.format(str(e)), e)
 # pylint: enable=W0611
 
+import collections
+import contextlib
 import enum
 import threading
 
@@ -47,13 +49,15 @@ from pynput._util.xorg import (
     alt_mask,
     alt_gr_mask,
     char_to_keysym,
+    clear_masks,
     display_manager,
     index_to_shift,
     keyboard_mapping,
     ListenerMixin,
     numlock_mask,
     shift_to_index,
-    symbol_to_keysym)
+    symbol_to_keysym,
+    X11Error)
 from pynput._util.xorg_keysyms import (
     CHARS,
     DEAD_KEYS,
@@ -63,14 +67,18 @@ from pynput._util.xorg_keysyms import (
 from . import _base
 
 
+#: A cache of *keysyms* for symbol names, as returned by
+#: :func:`pynput._util.xorg.symbol_to_keysym`
+_SYMBOL_KEYSYM_CACHE = {}
+
+
 class KeyCode(_base.KeyCode):
     _PLATFORM_EXTENSIONS = (
         # The symbol name for this key
         '_symbol',
     )
 
-    # Be explicit about fields
-    _symbol = None
+    __slots__ = _PLATFORM_EXTENSIONS
 
     @classmethod
     def _from_symbol(cls, symbol, **kwargs):
@@ -80,26 +88,11 @@ class KeyCode(_base.KeyCode):
 
         :return: a key code
         """
-        # First try simple translation
-        keysym = Xlib.XK.string_to_keysym(symbol)
-        if keysym:
-            return cls.from_vk(keysym, _symbol=symbol, **kwargs)
-
-        # If that fails, try checking a module attribute of Xlib.keysymdef.xkb
-        if not keysym:
-            # pylint: disable=W0702; we want to ignore errors
-            try:
-                symbol = 'XK_' + symbol
-                return cls.from_vk(
-                    getattr(Xlib.keysymdef.xkb, symbol, 0),
-                    _symbol=symbol,
-                    **kwargs)
-            except:
-                return cls.from_vk(
-                    SYMBOLS.get(symbol, (0,))[0],
-                    _symbol=symbol,
-                    **kwargs)
-            # pylint: enable=W0702
+        keysym = _SYMBOL_KEYSYM_CACHE.get(symbol, None)
+        if keysym is None:
+            keysym = _SYMBOL_KEYSYM_CACHE.setdefault(
+                symbol, symbol_to_keysym(symbol))
+        return cls.from_vk(keysym, _symbol=symbol, **kwargs)
 
     @classmethod
     def _from_media(cls, name, **kwargs):
@@ -185,6 +178,19 @@ class Controller(NotifierMixin, _base.Controller):
     _KeyCode = KeyCode
     _Key = Key
 
+    #: The event classes used with XSendEvent for presses and releases
+    _PRESS_EVENT = Xlib.display.event.KeyPress
+    _RELEASE_EVENT = Xlib.display.event.KeyRelease
+
+    #: The event types used with XTest for presses and releases
+    _FAKE_PRESS = Xlib.X.KeyPress
+    _FAKE_RELEASE = Xlib.X.KeyRelease
+
+    #: The maximum number of keycodes changed by us for which ``MappingNotify``
+    #: is awaited; if a notification is missed, for example because the server
+    #: coalesced several changes, the entry is eventually dropped
+    _MAX_MAPPING_CHANGES = 64
+
     #: The shift mask for :attr:`Key.ctrl`
     CTRL_MASK = Xlib.X.ControlMask
 
@@ -195,8 +201,15 @@ class Controller(NotifierMixin, _base.Controller):
         super(Controller, self).__init__(*args, **kwargs)
         self._display = Xlib.display.Display()
         self._keyboard_mapping = None
-        self._borrows = {}
-        self._borrow_lock = threading.RLock()
+        self._full_mapping = None
+        self._free_keycodes = collections.deque()
+        self._free_slots = collections.deque()
+        self._mapping_changes = collections.deque(
+            maxlen=self._MAX_MAPPING_CHANGES)
+        self._char_keysyms = {}
+        self._borrows = collections.OrderedDict()
+        self._borrow_lock = threading.Lock()
+        self._batch = threading.local()
 
         # pylint: disable=C0103; this is treated as a class scope constant, but
         # we cannot set it in the class scope, as it requires a Display instance
@@ -204,10 +217,26 @@ class Controller(NotifierMixin, _base.Controller):
         self.ALT_GR_MASK = alt_gr_mask(self._display)
         # pylint: enable=C0103
 
+        # A lookup table from a bitmap of active modifiers, as calculated by
+        # _shift_mask, to the corresponding X modifier mask
+        self._shift_mask_table = [
+            0
+            | (self.ALT_MASK if bits & 1 else 0)
+            | (self.ALT_GR_MASK if bits & 2 else 0)
+            | (self.CTRL_MASK if bits & 4 else 0)
+            | (self.SHIFT_MASK if bits & 8 else 0)
+            for bits in range(16)]
+
     def __del__(self):
         if hasattr(self, '_display'):
             self._display.close()
 
+    def type(self, string):
+        # Send all events for the string using a single display manager; this
+        # saves one round trip per event
+        with self._display_manager():
+            super(Controller, self).type(string)
+
     @property
     def keyboard_mapping(self):
         """A mapping from *keysyms* to *key codes*.
@@ -216,7 +245,7 @@ class Controller(NotifierMixin, _base.Controller):
         event with the specified *key code* and shift state, the specified
         *keysym* will be touched.
         """
-        if not self._keyboard_mapping:
+        if self._keyboard_mapping is None:
             self._update_keyboard_mapping()
         return self._keyboard_mapping
 
@@ -226,40 +255,52 @@ class Controller(NotifierMixin, _base.Controller):
         :param int key: The key to handle.
         :param bool is_press: Whether this is a press.
         """
-        event = Xlib.display.event.KeyPress if is_press \
-            else Xlib.display.event.KeyRelease
-        keysym = self._keysym(key)
-
-        # Make sure to verify that the key was resolved
-        if keysym is None:
-            raise self.InvalidKeyException(key)
-
-        # If the key has a virtual key code, use that immediately with
-        # fake_input; fake input,being an X server extension, has access to
-        # more internal state that we do
-        if key.vk is not None:
-            with display_manager(self._display) as dm:
+        # Resolve and send the key using a single display manager; this
+        # saves a round trip if the keyboard mapping must be updated
+        with self._display_manager() as dm:
+            # Look up the focus again for every press, since it may change
+            # while a long string is typed; a release is sent to the window
+            # that received the press
+            if is_press:
+                self._batch.window = None
+
+            self._check_mapping_notify()
+            keysym = self._keysym(key)
+
+            # Make sure to verify that the key was resolved
+            if keysym is None:
+                raise self.InvalidKeyException(key)
+
+            # If the key has a virtual key code, use that immediately with
+            # fake_input; fake input,being an X server extension, has access
+            # to more internal state that we do
+            if key.vk is not None:
                 Xlib.ext.xtest.fake_input(
                     dm,
-                    Xlib.X.KeyPress if is_press else Xlib.X.KeyRelease,
+                    self._FAKE_PRESS if is_press else self._FAKE_RELEASE,
                     dm.keysym_to_keycode(key.vk))
 
-        # Otherwise use XSendEvent; we need to use this in the general case to
-        # work around problems with keyboard layouts
-        else:
-            try:
-                keycode, shift_state = self.keyboard_mapping[keysym]
-                self._send_key(event, keycode, shift_state)
-
-            except KeyError:
-                with self._borrow_lock:
-                    keycode, index, count = self._borrows[keysym]
-                    self._send_key(
-                        event,
-                        keycode,
-                        index_to_shift(self._display, index))
-                    count += 1 if is_press else -1
-                    self._borrows[keysym] = (keycode, index, count)
+            # Otherwise use XSendEvent; we need to use this in the general case
+            # to work around problems with keyboard layouts
+            else:
+                event = self._PRESS_EVENT if is_press else self._RELEASE_EVENT
+                try:
+                    keycode, shift_state = self.keyboard_mapping[keysym]
+                    self._send_key(event, keycode, shift_state)
+
+                except KeyError:
+                    with self._borrow_lock:
+                        keycode, index, count = self._borrows[keysym]
+                        self._send_key(
+                            event,
+                            keycode,
+                            index_to_shift(self._display, index))
+                        count += 1 if is_press else -1
+
+                        # Move the keysym last to keep the least recently used
+                        # borrowed keysyms first
+                        del self._borrows[keysym]
+                        self._borrows[keysym] = (keycode, index, count)
 
         # Notify any running listeners
         self._emit('_on_fake_event', key, is_press)
@@ -269,11 +310,21 @@ class Controller(NotifierMixin, _base.Controller):
 
         :param KeyCode key: The key code to convert.
         """
-        return self._resolve_dead(key) if key.is_dead else None \
-            or self._resolve_special(key) \
-            or self._resolve_normal(key) \
-            or self._resolve_borrowed(key) \
-            or self._resolve_borrowing(key)
+        if key.is_dead:
+            return self._resolve_dead(key)
+
+        # Calculate the keysym only once and pass it to all resolvers
+        keysym = self._key_to_keysym(key)
+        for resolver in (
+                self._resolve_special,
+                self._resolve_normal,
+                self._resolve_borrowed,
+                self._resolve_borrowing):
+            resolved = resolver(key, keysym)
+            if resolved:
+                return resolved
+
+        return None
 
     def _send_key(self, event, keycode, shift_state):
         """Sends a single keyboard event.
@@ -285,10 +336,8 @@ class Controller(NotifierMixin, _base.Controller):
         :param int shift_state: The shift state. The actual value used is
             :attr:`shift_state` or'd with this value.
         """
-        with display_manager(self._display) as dm, self.modifiers as modifiers:
-            # Under certain cimcumstances, such as when running under Xephyr,
-            # the value returned by dm.get_input_focus is an int
-            window = dm.get_input_focus().focus
+        with self._display_manager() as dm, self.modifiers as modifiers:
+            window = self._focus(dm)
             send_event = getattr(
                 window,
                 'send_event',
@@ -303,44 +352,97 @@ class Controller(NotifierMixin, _base.Controller):
                 child=Xlib.X.NONE,
                 root_x=0, root_y=0, event_x=0, event_y=0))
 
+    @contextlib.contextmanager
+    def _display_manager(self):
+        """Manages the display of this controller.
+
+        When used in a context started by the same thread, the outer
+        :func:`~pynput._util.xorg.display_manager` is reused, and the display
+        is sync'd and any errors raised only when the outermost context exits.
+
+        :return: the display
+        """
+        batch = self._batch
+        if getattr(batch, 'display', None) is not None:
+            yield batch.display
+            return
+
+        try:
+            with display_manager(self._display) as dm:
+                batch.display = dm
+                batch.window = None
+                try:
+                    yield dm
+                finally:
+                    batch.display = None
+                    batch.window = None
+
+        except X11Error:
+            # We cannot know whether the mapping was changed while borrowing
+            # keysyms, so make sure to fetch it again
+            self._full_mapping = None
+            raise
+
+    def _focus(self, display):
+        """Returns the window currently having input focus.
+
+        The window is cached in the context started with
+        :meth:`_display_manager`, until the next key press.
+
+        :param display: The current *X* display.
+        """
+        batch = self._batch
+        if batch.window is None:
+            # Under certain cimcumstances, such as when running under Xephyr,
+            # the value returned by dm.get_input_focus is an int
+            batch.window = display.get_input_focus().focus
+        return batch.window
+
     def _resolve_dead(self, key):
         """Tries to resolve a dead key.
 
-        :param str identifier: The identifier to resolve.
+        :param KeyCode key: The key to resolve.
         """
-        # pylint: disable=W0702; we want to ignore errors
-        try:
-            keysym, _ = SYMBOLS[CHARS[key.combining]]
-        except:
+        symbol = CHARS.get(key.combining, None)
+        if symbol is None:
+            return None
+
+        entry = SYMBOLS.get(symbol, None)
+        if entry is None:
             return None
-        # pylint: enable=W0702
 
+        keysym = entry[0]
         if keysym not in self.keyboard_mapping:
             return None
 
         return keysym
 
-    def _resolve_special(self, key):
+    def _resolve_special(self, key, keysym):
         """Tries to resolve a special key.
 
         A special key has the :attr:`~KeyCode.vk` attribute set.
 
         :param KeyCode key: The key to resolve.
+
+        :param keysym: The *keysym* of the key, as returned by
+            :meth:`_key_to_keysym`.
         """
         if not key.vk:
             return None
 
         return key.vk
 
-    def _resolve_normal(self, key):
+    def _resolve_normal(self, key, keysym):
         """Tries to resolve a normal key.
 
         A normal key exists on the keyboard, and is typed by pressing
         and releasing a simple key, possibly in combination with a modifier.
 
         :param KeyCode key: The key to resolve.
+
+        :param keysym: The *keysym* of the key, as returned by
+            :meth:`_key_to_keysym`.
         """
-        keysym = self._key_to_keysym(key)
         if keysym is None:
             return None
 
@@ -349,15 +451,17 @@ class Controller(NotifierMixin, _base.Controller):
 
         return keysym
 
-    def _resolve_borrowed(self, key):
+    def _resolve_borrowed(self, key, keysym):
         """Tries to resolve a key by looking up the already borrowed *keysyms*.
 
         A borrowed *keysym* does not exist on the keyboard, but has been
         temporarily added to the layout.
 
         :param KeyCode key: The key to resolve.
+
+        :param keysym: The *keysym* of the key, as returned by
+            :meth:`_key_to_keysym`.
         """
-        keysym = self._key_to_keysym(key)
         if keysym is None:
             return None
 
@@ -367,60 +471,78 @@ class Controller(NotifierMixin, _base.Controller):
 
         return keysym
 
-    def _resolve_borrowing(self, key):
+    def _resolve_borrowing(self, key, keysym):
         """Tries to resolve a key by modifying the layout temporarily.
 
         A borrowed *keysym* does not exist on the keyboard, but is temporarily
         added to the layout.
 
         :param KeyCode key: The key to resolve.
+
+        :param keysym: The *keysym* of the key, as returned by
+            :meth:`_key_to_keysym`.
         """
-        keysym = self._key_to_keysym(key)
         if keysym is None:
             return None
 
-        mapping = self._display.get_keyboard_mapping(8, 255 - 8)
-
         def i2kc(index):
             return index + 8
 
         def kc2i(keycode):
             return keycode - 8
 
-        #: Finds a keycode and index by looking at already used keycodes
-        def reuse():
-            for _, (keycode, _, _) in self._borrows.items():
-                keycodes = mapping[kc2i(keycode)]
+        #: Fetches the full mapping and calculates the free keycodes and slots
+        def load(dm):
+            self._full_mapping = dm.get_keyboard_mapping(8, 255 - 8)
+            self._free_keycodes = collections.deque(
+                i2kc(i)
+                for i, keycodes in enumerate(self._full_mapping)
+                if not any(keycodes))
+            self._free_slots = collections.deque(
+                (keycode, index)
+                for keycode in sorted(set(
+                    keycode for keycode, _, _ in self._borrows.values()))
 
                 # Only the first four items are addressable by X
-                for index in range(4):
-                    if not keycodes[index]:
-                        return keycode, index
+                for index in range(4)
+                if not self._full_mapping[kc2i(keycode)][index])
+
+        #: Finds a keycode and index by looking at already used keycodes
+        def reuse():
+            if self._free_slots:
+                return self._free_slots.popleft()
 
         #: Finds a keycode and index by using a new keycode
         def borrow():
-            for i, keycodes in enumerate(mapping):
-                if not any(keycodes):
-                    return i2kc(i), 0
+            if self._free_keycodes:
+                return self._free_keycodes.popleft(), 0
 
-        #: Finds a keycode and index by reusing an old, unused one
+        #: Finds a keycode and index by reusing the least recently used unused
+        #: one
         def overwrite():
-            for keysym, (keycode, index, count) in self._borrows.items():
-                if count < 1:
-                    del self._borrows[keysym]
-                    return keycode, index
+            unused = next(
+                (
+                    (keysym, keycode, index)
+                    for keysym, (keycode, index, count)
+                    in self._borrows.items()
+                    if count < 1),
+                None)
+            if unused is not None:
+                keysym, keycode, index = unused
+                self._borrows.pop(keysym)
+                return keycode, index
 
         #: Registers a keycode for a specific key and modifier state
         def register(dm, keycode, index):
             i = kc2i(keycode)
+            is_new = all(m == Xlib.XK.NoSymbol for m in mapping[i])
 
             # Check for use of empty mapping with a character that has upper
             # and lower forms
             lower = key.char.lower()
             upper = key.char.upper()
-            if lower != upper and len(lower) == 1 and len(upper) == 1 and all(
-                    m == Xlib.XK.NoSymbol
-                    for m in mapping[i]):
+            if lower != upper and len(lower) == 1 and len(upper) == 1 \
+                    and is_new:
                 lower = self._key_to_keysym(KeyCode.from_char(lower))
                 upper = self._key_to_keysym(KeyCode.from_char(upper))
                 if lower:
@@ -432,10 +554,26 @@ class Controller(NotifierMixin, _base.Controller):
             else:
                 mapping[i][index] = keysym
                 self._borrows[keysym] = (keycode, index, 0)
+
+            # The remaining slots of a newly borrowed keycode can be reused
+            if is_new:
+                self._free_slots.extend(
+                    (keycode, j)
+                    for j in range(4)
+                    if not mapping[i][j])
+
+            self._mapping_changes.append(keycode)
             dm.change_keyboard_mapping(keycode, mapping[i:i + 1])
 
         try:
-            with display_manager(self._display) as dm, self._borrow_lock as _:
+            with self._display_manager() as dm, self._borrow_lock as _:
+                # The full mapping is cached and updated locally when we
+                # register a keysym; it is only fetched again if another
+                # client changes it
+                if self._full_mapping is None:
+                    load(dm)
+                mapping = self._full_mapping
+
                 # First try an already used keycode, then try a new one, and
                 # fall back on reusing one that is not currently pressed
                 register(dm, *(
@@ -459,22 +597,36 @@ class Controller(NotifierMixin, _base.Controller):
         if key.vk is not None:
             return key.vk
 
+        # The keysym for a character never changes, so we cache the result,
+        # including failures
+        try:
+            return self._char_keysyms[key.char]
+        except KeyError:
+            keysym = self._char_to_keysym(key.char)
+            self._char_keysyms[key.char] = keysym
+            return keysym
+
+    def _char_to_keysym(self, char):
+        """Converts a character to a *keysym*.
+
+        :param str char: The character.
+
+        :return: a keysym if found
+        :rtype: int or None
+        """
         # If the character has no associated symbol, we try to map the
         # character to a keysym
-        symbol = CHARS.get(key.char, None)
+        symbol = CHARS.get(char, None)
         if symbol is None:
-            return char_to_keysym(key.char)
+            return char_to_keysym(char)
 
-        # Otherwise we attempt to convert the symbol to a keysym
-        # pylint: disable=W0702; we want to ignore errors
-        try:
-            return symbol_to_keysym(symbol)
-        except:
-            try:
-                return SYMBOLS[symbol][0]
-            except:
-                return None
-        # pylint: enable=W0702
+        # Otherwise we convert the symbol to a keysym; this never raises, and
+        # it falls back on our pre-generated table
+        keysym = _SYMBOL_KEYSYM_CACHE.get(symbol, None)
+        if keysym is None:
+            keysym = _SYMBOL_KEYSYM_CACHE.setdefault(
+                symbol, symbol_to_keysym(symbol))
+        return keysym or None
 
     def _shift_mask(self, modifiers):
         """The *X* modifier mask to apply for a set of modifiers.
@@ -482,25 +634,60 @@ class Controller(NotifierMixin, _base.Controller):
         :param set modifiers: A set of active modifiers for which to get the
             shift mask.
         """
-        return (
+        return self._shift_mask_table[
             0
-            | (self.ALT_MASK
-               if Key.alt in modifiers else 0)
-
-            | (self.ALT_GR_MASK
-               if Key.alt_gr in modifiers else 0)
-
-            | (self.CTRL_MASK
-               if Key.ctrl in modifiers else 0)
-
-            | (self.SHIFT_MASK
-               if Key.shift in modifiers else 0))
+            | (1 if Key.alt in modifiers else 0)
+            | (2 if Key.alt_gr in modifiers else 0)
+            | (4 if Key.ctrl in modifiers else 0)
+            | (8 if Key.shift in modifiers else 0)]
+
+    def _check_mapping_notify(self):
+        """Reads pending *X* events and invalidates the cached keyboard
+        mappings if another client has changed the keyboard mapping.
+
+        *X* sends ``MappingNotify`` events to all clients, so no event
+        selection is required. Notifications caused by our own borrowing of
+        keycodes are skipped, since the cached mappings are updated locally in
+        that case; the keycode cache of *Xlib* is not refreshed for them
+        either, as that would require a round trip, and borrowed keysyms are
+        always resolved through :attr:`_borrows`.
+        """
+        display = self._display
+        while display.pending_events():
+            event = display.next_event()
+            if event.type != Xlib.X.MappingNotify \
+                    or event.request != Xlib.X.MappingKeyboard:
+                continue
+
+            if event.count == 1 \
+                    and event.first_keycode in self._mapping_changes:
+                self._mapping_changes.remove(event.first_keycode)
+                continue
+
+            # Keep the keycode cache of Xlib up to date as well
+            display.refresh_keyboard_mapping(event)
+            self._invalidate_keyboard_mapping()
+
+    def _invalidate_keyboard_mapping(self):
+        """Marks the cached keyboard mappings as stale.
+
+        The mappings are not reloaded until they are next needed, so any
+        number of invalidations between two key events cause only one reload.
+        """
+        self._keyboard_mapping = None
+        self._full_mapping = None
 
     def _update_keyboard_mapping(self):
         """Updates the keyboard mapping.
+
+        Borrowed *keysyms* are not included, since they are tracked separately.
         """
-        with display_manager(self._display) as dm:
-            self._keyboard_mapping = keyboard_mapping(dm)
+        with self._display_manager() as dm:
+            mapping = keyboard_mapping(dm)
+        with self._borrow_lock:
+            for keysym in self._borrows:
+                mapping.pop(keysym, None)
+        self._keyboard_mapping = mapping
 
 
 @Controller._receiver
@@ -553,6 +740,8 @@ class Listener(ListenerMixin, _base.Listener):
     def __init__(self, *args, **kwargs):
         super(Listener, self).__init__(*args, **kwargs)
         self._keyboard_mapping = None
+        self._min_keycode = 0
+        self._numlock_mask = 0
 
     def _run(self):
         with self._receive():
@@ -563,8 +752,15 @@ class Listener(ListenerMixin, _base.Listener):
         # key codes
         min_keycode = display.display.info.min_keycode
         keycode_count = display.display.info.max_keycode - min_keycode + 1
+        self._min_keycode = min_keycode
         self._keyboard_mapping = display.get_keyboard_mapping(
             min_keycode, keycode_count)
+        self._numlock_mask = numlock_mask(display)
+
+    def _handle_batch(self, display):
+        # Checking for mapping changes only polls the local event queue, so
+        # it is cheap enough to do once per batch
+        self._check_mapping_notify(display)
 
     def _handle(self, display, event):
         # Convert the event to a KeyCode; this may fail, and in that case we
@@ -598,30 +794,51 @@ class Listener(ListenerMixin, _base.Listener):
         (self.on_press if is_press else self.on_release)(
             self._SPECIAL_KEYS.get(key.vk, key))
 
-    def _keycode_to_keysym(self, display, keycode, index):
+    def _check_mapping_notify(self, display):
+        """Reads pending *X* events and reloads the cached keyboard mapping and
+        modifier masks if the mapping has changed.
+
+        *X* sends ``MappingNotify`` events to all clients, so no event
+        selection is required.
+
+        :param display: The current *X* display.
+        """
+        changed = False
+        while display.pending_events():
+            event = display.next_event()
+            if event.type == Xlib.X.MappingNotify:
+                display.refresh_keyboard_mapping(event)
+                changed = changed or event.request in (
+                    Xlib.X.MappingKeyboard, Xlib.X.MappingModifier)
+
+        if changed:
+            clear_masks(display)
+            self._initialize(display)
+
+    def _keycode_to_keysym(self, keycode, index):
         """Converts a keycode and shift state index to a keysym.
 
         This method uses a simplified version of the *X* convention to locate
         the correct keysym in the display table: since this method is only used
         to locate special keys, alphanumeric keys are not treated specially.
 
-        :param display: The current *X* display.
+        The keysym is read from the keyboard mapping cached when the listener
+        was started.
 
         :param keycode: The keycode.
 
         :param index: The shift state index.
 
         :return: a keysym
+
+        :raises IndexError: if the key code is invalid
         """
-        keysym = display.keycode_to_keysym(keycode, index)
-        if keysym:
-            return keysym
-        elif index & 0x2:
-            return self._keycode_to_keysym(display, keycode, index & ~0x2)
-        elif index & 0x1:
-            return self._keycode_to_keysym(display, keycode, index & ~0x1)
-        else:
-            return 0
+        keysyms = self._keyboard_mapping[keycode - self._min_keycode]
+        for i in (index, index & ~0x2, 0):
+            keysym = keysyms[i] if i < len(keysyms) else 0
+            if keysym:
+                return keysym
+        return 0
 
     def _event_to_key(self, display, event):
         """Converts an *X* event to a :class:`KeyCode`.
@@ -638,26 +855,26 @@ class Listener(ListenerMixin, _base.Listener):
         index = shift_to_index(display, event.state)
 
         # First try special keys...
-        keysym = self._keycode_to_keysym(display, keycode, index)
-        if keysym in self._SPECIAL_KEYS:
-            return self._SPECIAL_KEYS[keysym]
+        keysym = self._keycode_to_keysym(keycode, index)
+        special = self._SPECIAL_KEYS.get(keysym, None)
+        if special is not None:
+            return special
         elif keysym in self._KEYPAD_KEYS:
             # We must recalculate the index if numlock is active; index 1 is the
-            # one to use
-            try:
-                return self._KEYPAD_KEYS[
-                    self._keycode_to_keysym(
-                        display,
-                        keycode,
-                        bool(event.state & numlock_mask(display)))]
-            except KeyError:
-                # Since we recalculated the key, this may happen
-                pass
+            # one to use; since we recalculate the key, it may not be a keypad
+            # key
+            keypad = self._KEYPAD_KEYS.get(
+                self._keycode_to_keysym(
+                    keycode,
+                    bool(event.state & self._numlock_mask)),
+                None)
+            if keypad is not None:
+                return keypad
 
         # ...then try characters...
-        name = KEYSYMS.get(keysym, None)
-        if name is not None and name in SYMBOLS:
-            char = SYMBOLS[name][1].upper() if index & 1 else SYMBOLS[name][1]
+        entry = SYMBOLS.get(KEYSYMS.get(keysym, None), None)
+        if entry is not None:
+            char = entry[1].upper() if index & 1 else entry[1]
             if char in DEAD_KEYS:
                 return KeyCode.from_dead(DEAD_KEYS[char], vk=keysym)
             else:
@@ -52,6 +52,8 @@ class Events(Events):
     class Move(Events.Event):
         """A move event.
         """
+        __slots__ = ('x', 'y')
+
         def __init__(self, x, y):
             #: The X screen coordinate.
             self.x = x
@@ -62,6 +64,8 @@ class Events(Events):
     class Click(Events.Event):
         """A click event.
         """
+        __slots__ = ('x', 'y', 'button', 'pressed')
+
         def __init__(self, x, y, button, pressed):
             #: The X screen coordinate.
             self.x = x
@@ -78,6 +82,8 @@ class Events(Events):
     class Scroll(Events.Event):
         """A scroll event.
         """
+        __slots__ = ('x', 'y', 'dx', 'dy')
+
         def __init__(self, x, y, dx, dy):
             #: The X screen coordinate.
             self.x = x
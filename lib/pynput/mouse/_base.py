@@ -25,6 +25,7 @@ is located in a platform dependent module.
 # We implement stubs
 
 import enum
+import numbers
 
 from pynput._util import AbstractListener, prefix
 from pynput import _logger
@@ -82,6 +83,20 @@ class Controller(object):
         """
         self._scroll(dx, dy)
 
+    def scroll_many(self, deltas):
+        """Sends a series of scroll events.
+
+        This is equivalent to calling :meth:`scroll` for every item in
+        ``deltas``, but platforms may send the events more efficiently.
+
+        :param deltas: The scroll vectors, as an iterable of tuples
+            ``(dx, dy)``.
+
+        :raises ValueError: if the values are invalid, for example out of
+            bounds
+        """
+        self._scroll_many(deltas)
+
     def press(self, button):
         """Emits a button press event at the current position.
 
@@ -107,7 +122,8 @@ class Controller(object):
         :raises ValueError: if the values are invalid, for example out of
             bounds
         """
-        self.position = tuple(sum(i) for i in zip(self.position, (dx, dy)))
+        x, y = self._position_get()
+        self._position_set((x + dx, y + dy))
 
     def click(self, button, count=1):
         """Emits a button click event at the current position.
@@ -160,6 +176,14 @@ class Controller(object):
         """
         raise NotImplementedError()
 
+    def _scroll_many(self, deltas):
+        """The implementation of the :meth:`scroll_many` method.
+
+        The default implementation calls :meth:`_scroll` for every vector.
+        """
+        for dx, dy in deltas:
+            self._scroll(dx, dy)
+
     def _press(self, button):
         """The implementation of the :meth:`press` method.
 
@@ -238,6 +262,33 @@ class Listener(AbstractListener):
             ``Quartz.CGEventSetIntegerValueField``. If this callable does not
             return the event, the event is suppressed system wide.
 
+        ``darwin_event_filter``
+            A callable taking the arguments ``(event_type, event)``, where
+            ``event_type`` is any mouse related event type constant, and
+            ``event`` is a ``CGEventRef``.
+
+            If this callback returns ``False``, the event will not be
+            propagated to the listener callback. It is called before any
+            other processing of the event, so returning ``False`` for
+            ``Quartz.kCGEventMouseMoved`` is a cheap way to ignore mouse
+            movement.
+
+        ``darwin_coalesce_moves``
+            The minimum interval, in seconds, between two calls to
+            ``on_move``, as a non-negative number. ``True`` selects a default
+            interval of 1/60 of a second, and ``False`` or ``0`` disables
+            coalescing. Move events arriving more often than this are
+            coalesced, and only the latest position is reported. A pending
+            move is always reported before any click or scroll event, and
+            when the listener is stopped.
+
+        ``xorg_merge_moves``
+            Whether to merge move events delivered together. The *X* server
+            delivers recorded events in batches; if this is ``True``, only the
+            last of a run of consecutive move events in a batch is reported to
+            ``on_move``. Unlike ``darwin_coalesce_moves``, this is not a time
+            interval, and moves arriving in separate batches are all reported.
+
         ``win32_event_filter``
             A callable taking the arguments ``(msg, data)``, where ``msg`` is
             the current message, and ``data`` associated data as a
@@ -248,7 +299,17 @@ class Listener(AbstractListener):
 
             If ``self.suppress_event()`` is called, the event is suppressed
             system wide.
+
+        ``win32_coalesce_moves``
+            The minimum interval, in seconds, between two calls to
+            ``on_move``, as a non-negative number or a boolean. This works
+            like ``darwin_coalesce_moves``, and a pending move is likewise
+            reported when the listener is stopped.
     """
+    #: The interval used when the platform option ``coalesce_moves`` is
+    #: ``True``
+    _DEFAULT_COALESCE_INTERVAL = 1.0 / 60
+
     def __init__(self, on_move=None, on_click=None, on_scroll=None,
                  suppress=False, **kwargs):
         self._log = _logger(self.__class__)
@@ -260,4 +321,23 @@ class Listener(AbstractListener):
         super(Listener, self).__init__(
             on_move=on_move, on_click=on_click, on_scroll=on_scroll,
             suppress=suppress)
+
+    def _coalesce_interval(self):
+        """Reads the platform option ``coalesce_moves``.
+
+        :return: the minimum interval, in seconds, between two move events, or
+            ``None`` if move events are not coalesced
+
+        :raises ValueError: if the option is neither a boolean nor a
+            non-negative number
+        """
+        value = self._options.get('coalesce_moves', None)
+        if value is None or value is False:
+            return None
+        elif value is True:
+            return self._DEFAULT_COALESCE_INTERVAL
+        elif not isinstance(value, numbers.Real) or value < 0:
+            raise ValueError(value)
+        else:
+            return value or None
 # pylint: enable=W0223
@@ -25,10 +25,29 @@ The mouse implementation for *macOS*.
 # We implement stubs
 
 import enum
-import Quartz
+import functools
+import operator
+import time
 
-from AppKit import NSEvent
+import Quartz
 
+from Quartz import (
+    CGEventCreate,
+    CGEventCreateMouseEvent,
+    CGEventCreateScrollWheelEvent,
+    CGEventGetIntegerValueField,
+    CGEventGetLocation,
+    CGEventPost,
+    CGEventSetIntegerValueField,
+    kCGEventMouseMoved,
+    kCGEventScrollWheel,
+    kCGHIDEventTap,
+    kCGMouseEventClickState,
+    kCGScrollEventUnitPixel,
+    kCGScrollWheelEventDeltaAxis1,
+    kCGScrollWheelEventDeltaAxis2)
+
+from pynput._util import AbstractListener
 from pynput._util.darwin import (
     ListenerMixin)
 from . import _base
@@ -64,149 +83,294 @@ class Controller(_base.Controller):
     #: The scroll speed
     _SCROLL_SPEED = 10
 
+    #: A mapping from buttons to the tuple ``(press, release, drag,
+    #: mouse_button)``
+    _BUTTON_VALUES = {
+        button: button.value[0] + (button.value[1],)
+        for button in Button
+        if button.value is not None}
+
     def __init__(self, *args, **kwargs):
         super(Controller, self).__init__(*args, **kwargs)
         self._click = None
+        self._click_position = None
         self._drag_button = None
 
     def _position_get(self):
-        pos = NSEvent.mouseLocation()
+        # An empty event has the current pointer location in the global
+        # display coordinate space, so no flipping is required
+        pos = CGEventGetLocation(CGEventCreate(None))
 
-        return pos.x, Quartz.CGDisplayPixelsHigh(0) - pos.y
+        return pos.x, pos.y
 
     def _position_set(self, pos):
-        try:
-            (_, _, mouse_type), mouse_button = self._drag_button.value
-        except AttributeError:
-            mouse_type = Quartz.kCGEventMouseMoved
+        if self._click is not None:
+            self._click_position = pos
+
+        if self._drag_button is None:
+            mouse_type = kCGEventMouseMoved
             mouse_button = 0
+        else:
+            _, _, mouse_type, mouse_button = self._BUTTON_VALUES[
+                self._drag_button]
 
-        Quartz.CGEventPost(
-            Quartz.kCGHIDEventTap,
-            Quartz.CGEventCreateMouseEvent(
+        CGEventPost(
+            kCGHIDEventTap,
+            CGEventCreateMouseEvent(
                 None,
                 mouse_type,
                 pos,
                 mouse_button))
 
     def _scroll(self, dx, dy):
-        dx = int(dx)
-        dy = int(dy)
-
-        Quartz.CGEventPost(
-            Quartz.kCGHIDEventTap,
-            Quartz.CGEventCreateScrollWheelEvent(
-                None,
-                Quartz.kCGScrollEventUnitPixel,
-                2,
-                dy * self._SCROLL_SPEED,
-                dx * self._SCROLL_SPEED))
+        self._scroll_many(((dx, dy),))
+
+    def _scroll_many(self, deltas):
+        speed = self._SCROLL_SPEED
+        for dx, dy in deltas:
+            CGEventPost(
+                kCGHIDEventTap,
+                CGEventCreateScrollWheelEvent(
+                    None,
+                    kCGScrollEventUnitPixel,
+                    2,
+                    int(dy) * speed,
+                    int(dx) * speed))
 
     def _press(self, button):
-        (press, _, _), mouse_button = button.value
-        event = Quartz.CGEventCreateMouseEvent(
+        press, _, _, mouse_button = self._BUTTON_VALUES[button]
+        event = CGEventCreateMouseEvent(
             None,
             press,
-            self.position,
+            self._event_position(),
             mouse_button)
 
         # If we are performing a click, we need to set this state flag
         if self._click is not None:
             self._click += 1
-            Quartz.CGEventSetIntegerValueField(
+            CGEventSetIntegerValueField(
                 event,
-                Quartz.kCGMouseEventClickState,
+                kCGMouseEventClickState,
                 self._click)
 
-        Quartz.CGEventPost(Quartz.kCGHIDEventTap, event)
+        CGEventPost(kCGHIDEventTap, event)
 
         # Store the button to enable dragging
         self._drag_button = button
 
     def _release(self, button):
-        (_, release, _), mouse_button = button.value
-        event = Quartz.CGEventCreateMouseEvent(
+        _, release, _, mouse_button = self._BUTTON_VALUES[button]
+        event = CGEventCreateMouseEvent(
             None,
             release,
-            self.position,
+            self._event_position(),
             mouse_button)
 
         # If we are performing a click, we need to set this state flag
         if self._click is not None:
-            Quartz.CGEventSetIntegerValueField(
+            CGEventSetIntegerValueField(
                 event,
-                Quartz.kCGMouseEventClickState,
+                kCGMouseEventClickState,
                 self._click)
 
-        Quartz.CGEventPost(Quartz.kCGHIDEventTap, event)
+        CGEventPost(kCGHIDEventTap, event)
 
         if button == self._drag_button:
             self._drag_button = None
 
     def __enter__(self):
         self._click = 0
+        self._click_position = None
         return self
 
     def __exit__(self, exc_type, value, traceback):
         self._click = None
+        self._click_position = None
+
+    def _event_position(self):
+        """The position to use for button events.
+
+        When performing a click, the position is read only once, and then
+        updated only when this controller moves the pointer.
+        """
+        if self._click is None:
+            return self._position_get()
+        elif self._click_position is None:
+            self._click_position = self._position_get()
+        return self._click_position
 
 
 class Listener(ListenerMixin, _base.Listener):
     #: The events that we listen to
-    _EVENTS = (
-        Quartz.CGEventMaskBit(Quartz.kCGEventMouseMoved) |
-        Quartz.CGEventMaskBit(Quartz.kCGEventLeftMouseDown) |
-        Quartz.CGEventMaskBit(Quartz.kCGEventLeftMouseUp) |
-        Quartz.CGEventMaskBit(Quartz.kCGEventLeftMouseDragged) |
-        Quartz.CGEventMaskBit(Quartz.kCGEventRightMouseDown) |
-        Quartz.CGEventMaskBit(Quartz.kCGEventRightMouseUp) |
-        Quartz.CGEventMaskBit(Quartz.kCGEventRightMouseDragged) |
-        Quartz.CGEventMaskBit(Quartz.kCGEventOtherMouseDown) |
-        Quartz.CGEventMaskBit(Quartz.kCGEventOtherMouseUp) |
-        Quartz.CGEventMaskBit(Quartz.kCGEventOtherMouseDragged) |
-        Quartz.CGEventMaskBit(Quartz.kCGEventScrollWheel))
+    _EVENTS = functools.reduce(
+        operator.or_,
+        (
+            Quartz.CGEventMaskBit(event_type)
+            for event_type in (
+                Quartz.kCGEventMouseMoved,
+                Quartz.kCGEventLeftMouseDown,
+                Quartz.kCGEventLeftMouseUp,
+                Quartz.kCGEventLeftMouseDragged,
+                Quartz.kCGEventRightMouseDown,
+                Quartz.kCGEventRightMouseUp,
+                Quartz.kCGEventRightMouseDragged,
+                Quartz.kCGEventOtherMouseDown,
+                Quartz.kCGEventOtherMouseUp,
+                Quartz.kCGEventOtherMouseDragged,
+                Quartz.kCGEventScrollWheel)))
+
+    #: A mapping from button event types to the tuple ``(button, is_press)``;
+    #: ``is_press`` is ``None`` for drag events
+    _BUTTON_EVENTS = {
+        event_type: (button, is_press)
+        for button in Button
+        if button.value is not None
+        for event_type, is_press in zip(button.value[0], (True, False, None))}
 
     def __init__(self, *args, **kwargs):
         super(Listener, self).__init__(*args, **kwargs)
         self._intercept = self._options.get(
             'intercept',
             None)
+        self._event_filter = self._options.get(
+            'event_filter',
+            None)
+        self._coalesce_moves = self._coalesce_interval()
+        self._pending_move = None
+        self._last_move = 0.0
+        self._last_position = None
+        self._move_timer = None
+
+    def _run(self):
+        try:
+            super(Listener, self)._run()
+        finally:
+            # The run loop has terminated, so the timer will not fire; report
+            # any coalesced move from this thread, as for any other event
+            timer, self._move_timer = self._move_timer, None
+            if timer is not None:
+                Quartz.CFRunLoopTimerInvalidate(timer)
+
+            # pylint: disable=W0702; we want to silence errors
+            try:
+                self._emit_pending_move()
+            except:
+                # This exception will have been passed to the main thread
+                pass
+            # pylint: enable=W0702
 
     def _handle(self, _proxy, event_type, event, _refcon):
         """The callback registered with *macOS* for mouse events.
 
         This method will call the callbacks registered on initialisation.
         """
+        # Ignore filtered events before doing any work on them
+        if self._event_filter is not None \
+                and self._event_filter(event_type, event) is False:
+            return
+
         try:
-            (px, py) = Quartz.CGEventGetLocation(event)
-        except AttributeError:
-            # This happens during teardown of the virtual machine
+            (px, py) = CGEventGetLocation(event)
+        except (AttributeError, TypeError):
+            # This happens during teardown of the virtual machine, when the
+            # module globals may have been cleared to None
             return
 
         # Quickly detect the most common event type
-        if event_type == Quartz.kCGEventMouseMoved:
-            self.on_move(px, py)
+        if event_type == kCGEventMouseMoved:
+            self._move(px, py)
+            return
+
+        # Make sure that a coalesced move is reported before any other event
+        if self._pending_move is not None:
+            self._flush_move()
 
-        elif event_type == Quartz.kCGEventScrollWheel:
-            dx = Quartz.CGEventGetIntegerValueField(
+        if event_type == kCGEventScrollWheel:
+            dx = CGEventGetIntegerValueField(
                 event,
-                Quartz.kCGScrollWheelEventDeltaAxis2)
-            dy = Quartz.CGEventGetIntegerValueField(
+                kCGScrollWheelEventDeltaAxis2)
+            dy = CGEventGetIntegerValueField(
                 event,
-                Quartz.kCGScrollWheelEventDeltaAxis1)
+                kCGScrollWheelEventDeltaAxis1)
             self.on_scroll(px, py, dx, dy)
 
         else:
-            for button in Button:
-                try:
-                    (press, release, drag), _ = button.value
-                except TypeError:
-                    # Button.unknown cannot be enumerated
-                    continue
-
-                # Press and release generate click events, and drag
-                # generates move events
-                if event_type in (press, release):
-                    self.on_click(px, py, button, event_type == press)
-                elif event_type == drag:
-                    self.on_move(px, py)
+            entry = self._BUTTON_EVENTS.get(event_type, None)
+            if entry is None:
+                return
+            button, is_press = entry
+
+            # Press and release generate click events, and drag generates
+            # move events
+            if is_press is None:
+                self._move(px, py)
+            else:
+                self.on_click(px, py, button, is_press)
+
+    def _move(self, px, py):
+        """Reports a move event.
+
+        If ``darwin_coalesce_moves`` is set, moves arriving within that
+        interval of the last reported move are not reported immediately;
+        instead the latest position is reported when the interval has passed,
+        or before the next event of another kind.
+
+        Moves to the position of the previous move are not reported; *macOS*
+        sends these when the pointer is pushed against the edge of the screen.
+
+        :param px: The X coordinate.
+
+        :param py: The Y coordinate.
+        """
+        position = (px, py)
+        if position == self._last_position:
+            return
+        self._last_position = position
+
+        if not self._coalesce_moves:
+            self.on_move(px, py)
+            return
+
+        now = time.time()
+        delay = self._last_move + self._coalesce_moves - now
+        if delay <= 0:
+            self._pending_move = None
+            self._last_move = now
+            self.on_move(px, py)
+            return
+
+        self._pending_move = position
+        if self._move_timer is None:
+            self._move_timer = Quartz.CFRunLoopTimerCreate(
+                None,
+                Quartz.CFAbsoluteTimeGetCurrent() + delay,
+                0, 0, 0,
+                self._on_move_timer,
+                None)
+            Quartz.CFRunLoopAddTimer(
+                Quartz.CFRunLoopGetCurrent(),
+                self._move_timer,
+                Quartz.kCFRunLoopDefaultMode)
+
+    def _flush_move(self):
+        """Reports a coalesced move event, if one is pending.
+        """
+        pending, self._pending_move = self._pending_move, None
+        if pending is not None:
+            self._last_move = time.time()
+            self.on_move(*pending)
+
+    @AbstractListener._emitter
+    def _on_move_timer(self, _timer, _info):
+        """The callback for the run loop timer used to report coalesced move
+        events.
+        """
+        self._move_timer = None
+        self._flush_move()
+
+    @AbstractListener._emitter
+    def _emit_pending_move(self):
+        """Reports a coalesced move event left pending when the listener
+        stops.
+        """
+        self._flush_move()
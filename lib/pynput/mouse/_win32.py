@@ -26,12 +26,13 @@ The mouse implementation for *Windows*.
 
 import ctypes
 import enum
+import time
 
 from ctypes import (
     windll,
     wintypes)
 
-from pynput._util import NotifierMixin
+from pynput._util import AbstractListener, NotifierMixin
 from pynput._util.win32 import (
     INPUT,
     INPUT_union,
@@ -44,6 +45,9 @@ from . import _base
 #: A constant used as a factor when constructing mouse scroll data.
 WHEEL_DELTA = 120
 
+#: The size of an INPUT structure, as passed to SendInput
+_INPUT_SIZE = ctypes.sizeof(INPUT)
+
 
 class Button(enum.Enum):
     """The various buttons.
@@ -60,6 +64,18 @@ class Controller(NotifierMixin, _base.Controller):
     __GetCursorPos = windll.user32.GetCursorPos
     __SetCursorPos = windll.user32.SetCursorPos
 
+    #: A mapping from buttons to the ``(flags, data)`` of a press event
+    _PRESS_EVENTS = {
+        button: (button.value[1], button.value[2])
+        for button in Button
+        if button.value is not None}
+
+    #: A mapping from buttons to the ``(flags, data)`` of a release event
+    _RELEASE_EVENTS = {
+        button: (button.value[0], button.value[2])
+        for button in Button
+        if button.value is not None}
+
     def __init__(self, *args, **kwargs):
         super(Controller, self).__init__(*args, **kwargs)
 
@@ -76,53 +92,55 @@ class Controller(NotifierMixin, _base.Controller):
         self._emit('on_move', *pos)
 
     def _scroll(self, dx, dy):
-        if dy:
-            SendInput(
-                1,
-                ctypes.byref(INPUT(
-                    type=INPUT.MOUSE,
-                    value=INPUT_union(
-                        mi=MOUSEINPUT(
-                            dwFlags=MOUSEINPUT.WHEEL,
-                            mouseData=int(dy * WHEEL_DELTA))))),
-                ctypes.sizeof(INPUT))
-
-        if dx:
-            SendInput(
-                1,
-                ctypes.byref(INPUT(
-                    type=INPUT.MOUSE,
-                    value=INPUT_union(
-                        mi=MOUSEINPUT(
-                            dwFlags=MOUSEINPUT.HWHEEL,
-                            mouseData=int(dx * WHEEL_DELTA))))),
-                ctypes.sizeof(INPUT))
-
-        if dx or dy:
+        self._scroll_many(((dx, dy),))
+
+    def _scroll_many(self, deltas):
+        # Send all axes of all vectors with a single call to SendInput
+        events = []
+        sent = []
+        for dx, dy in deltas:
+            if dy:
+                events.append((MOUSEINPUT.WHEEL, int(dy * WHEEL_DELTA)))
+            if dx:
+                events.append((MOUSEINPUT.HWHEEL, int(dx * WHEEL_DELTA)))
+            if dx or dy:
+                sent.append((dx, dy))
+
+        if events:
+            self._send(*events)
+
+            # Reading the position is only required to notify listeners
+            if not self._listeners():
+                return
             px, py = self._position_get()
-            self._emit('on_scroll', px, py, dx, dy)
+            for dx, dy in sent:
+                self._emit('on_scroll', px, py, dx, dy)
 
     def _press(self, button):
-        SendInput(
-            1,
-            ctypes.byref(INPUT(
-                type=INPUT.MOUSE,
-                value=INPUT_union(
-                    mi=MOUSEINPUT(
-                        dwFlags=button.value[1],
-                        mouseData=button.value[2])))),
-            ctypes.sizeof(INPUT))
+        self._send(self._PRESS_EVENTS[button])
 
     def _release(self, button):
-        SendInput(
-            1,
-            ctypes.byref(INPUT(
+        self._send(self._RELEASE_EVENTS[button])
+
+    def _send(self, *events):
+        """Sends mouse input events with a single call to ``SendInput``.
+
+        New ``INPUT`` structures are created for every call, since a
+        controller may be used from several threads.
+
+        :param events: The events to send, as tuples ``(flags, data)``, where
+            ``flags`` is the value of ``MOUSEINPUT.dwFlags`` and ``data`` the
+            value of ``MOUSEINPUT.mouseData``.
+        """
+        inputs = (INPUT * len(events))(*(
+            INPUT(
                 type=INPUT.MOUSE,
                 value=INPUT_union(
                     mi=MOUSEINPUT(
-                        dwFlags=button.value[0],
-                        mouseData=button.value[2])))),
-            ctypes.sizeof(INPUT))
+                        dwFlags=flags,
+                        mouseData=data)))
+            for flags, data in events))
+        SendInput(len(events), ctypes.byref(inputs), _INPUT_SIZE)
 
 
 @Controller._receiver
@@ -171,9 +189,37 @@ class Listener(ListenerMixin, _base.Listener):
         WM_MOUSEWHEEL: (0, 1),
         WM_MOUSEHWHEEL: (1, 0)}
 
+    #: A mapping from messages to the tuple ``(kind, value)``, where ``kind``
+    #: is ``'click'``, ``'x'`` or ``'scroll'`` and ``value`` the corresponding
+    #: value of :attr:`CLICK_BUTTONS`, :attr:`X_BUTTONS` or
+    #: :attr:`SCROLL_BUTTONS`; this allows a single lookup per message
+    _MESSAGES = dict(
+        [(msg, ('click', value)) for msg, value in CLICK_BUTTONS.items()] +
+        [(msg, ('x', value)) for msg, value in X_BUTTONS.items()] +
+        [(msg, ('scroll', value)) for msg, value in SCROLL_BUTTONS.items()])
+
     _HANDLED_EXCEPTIONS = (
         SystemHook.SuppressException,)
 
+    #: The message posted when a thread timer elapses
+    _WM_TIMER = 0x0113
+
+    _WM_NOTIFICATIONS = (
+        _WM_TIMER,
+    )
+
+    __SetTimer = windll.user32.SetTimer
+    __SetTimer.argtypes = (
+        wintypes.HWND,
+        wintypes.WPARAM,  # Really UINT_PTR
+        wintypes.UINT,
+        ctypes.c_void_p)
+    __SetTimer.restype = wintypes.WPARAM  # Really UINT_PTR
+    __KillTimer = windll.user32.KillTimer
+    __KillTimer.argtypes = (
+        wintypes.HWND,
+        wintypes.WPARAM)  # Really UINT_PTR
+
     class _MSLLHOOKSTRUCT(ctypes.Structure):
         """Contains information about a mouse event passed to a ``WH_MOUSE_LL``
         hook procedure, ``MouseProc``.
@@ -185,37 +231,128 @@ class Listener(ListenerMixin, _base.Listener):
             ('time', wintypes.DWORD),
             ('dwExtraInfo', ctypes.c_void_p)]
 
-    #: A pointer to a :class:`_MSLLHOOKSTRUCT`
-    _LPMSLLHOOKSTRUCT = ctypes.POINTER(_MSLLHOOKSTRUCT)
-
     def __init__(self, *args, **kwargs):
         super(Listener, self).__init__(*args, **kwargs)
         self._event_filter = self._options.get(
             'event_filter',
-            lambda msg, data: True)
+            None)
+        self._coalesce_moves = self._coalesce_interval()
+        self._pending_move = None
+        self._last_move = 0.0
+        self._move_timer = None
+
+    def _run(self):
+        try:
+            super(Listener, self)._run()
+        finally:
+            # The move timer is a thread timer, so it can only be killed from
+            # the thread that created it; any coalesced move is reported from
+            # this thread as well, as for any other event
+            timer, self._move_timer = self._move_timer, None
+            if timer is not None:
+                self.__KillTimer(None, timer)
+
+            # pylint: disable=W0702; we want to silence errors
+            try:
+                self._emit_pending_move()
+            except:
+                # This exception will have been passed to the main thread
+                pass
+            # pylint: enable=W0702
 
     def _handle(self, code, msg, lpdata):
         if code != SystemHook.HC_ACTION:
             return
 
-        data = ctypes.cast(lpdata, self._LPMSLLHOOKSTRUCT).contents
+        # The structure is read in place; this is cheaper than casting a
+        # pointer and dereferencing it
+        data = self._MSLLHOOKSTRUCT.from_address(lpdata)
 
         # Suppress further propagation of the event if it is filtered
-        if self._event_filter(msg, data) is False:
+        if self._event_filter is not None \
+                and self._event_filter(msg, data) is False:
             return
 
+        pt = data.pt
         if msg == self.WM_MOUSEMOVE:
-            self.on_move(data.pt.x, data.pt.y)
+            self._move(pt.x, pt.y)
+            return
+
+        entry = self._MESSAGES.get(msg, None)
+        if entry is None:
+            return
+        kind, value = entry
 
-        elif msg in self.CLICK_BUTTONS:
-            button, pressed = self.CLICK_BUTTONS[msg]
-            self.on_click(data.pt.x, data.pt.y, button, pressed)
+        # Make sure that a coalesced move is reported before any other event
+        if self._pending_move is not None:
+            self._flush_move()
 
-        elif msg in self.X_BUTTONS:
-            button, pressed = self.X_BUTTONS[msg][data.mouseData >> 16]
-            self.on_click(data.pt.x, data.pt.y, button, pressed)
+        if kind == 'click':
+            button, pressed = value
+            self.on_click(pt.x, pt.y, button, pressed)
 
-        elif msg in self.SCROLL_BUTTONS:
-            mx, my = self.SCROLL_BUTTONS[msg]
-            dd = wintypes.SHORT(data.mouseData >> 16).value // WHEEL_DELTA
-            self.on_scroll(data.pt.x, data.pt.y, dd * mx, dd * my)
+        elif kind == 'x':
+            button, pressed = value[data.mouseData >> 16]
+            self.on_click(pt.x, pt.y, button, pressed)
+
+        else:
+            mx, my = value
+            # The high word is a signed short; sign extend it without
+            # allocating a ctypes object
+            dd = (((data.mouseData >> 16) ^ 0x8000) - 0x8000) // WHEEL_DELTA
+            self.on_scroll(pt.x, pt.y, dd * mx, dd * my)
+
+    @AbstractListener._emitter
+    def _on_notification(self, code, wparam, lparam):
+        """Receives ``WM_TIMER`` and reports a coalesced move event.
+        """
+        if code == self._WM_TIMER and wparam == self._move_timer:
+            self.__KillTimer(None, self._move_timer)
+            self._move_timer = None
+            self._flush_move()
+
+    @AbstractListener._emitter
+    def _emit_pending_move(self):
+        """Reports a coalesced move event left pending when the listener
+        stops.
+        """
+        self._flush_move()
+
+    def _move(self, x, y):
+        """Reports a move event.
+
+        If ``win32_coalesce_moves`` is set, moves arriving within that
+        interval of the last reported move are not reported immediately;
+        instead the latest position is reported when the interval has passed,
+        or before the next event of another kind.
+
+        :param int x: The X coordinate.
+
+        :param int y: The Y coordinate.
+        """
+        if not self._coalesce_moves:
+            self.on_move(x, y)
+            return
+
+        now = time.time()
+        delay = self._last_move + self._coalesce_moves - now
+        if delay <= 0:
+            self._pending_move = None
+            self._last_move = now
+            self.on_move(x, y)
+            return
+
+        # The hook runs on the thread of the message loop, so the timer
+        # message will be posted to it
+        self._pending_move = (x, y)
+        if self._move_timer is None:
+            self._move_timer = self.__SetTimer(
+                None, 0, max(1, int(delay * 1000)), None)
+
+    def _flush_move(self):
+        """Reports a coalesced move event, if one is pending.
+        """
+        pending, self._pending_move = self._pending_move, None
+        if pending is not None:
+            self._last_move = time.time()
+            self.on_move(*pending)
@@ -86,16 +86,30 @@ class Controller(_base.Controller):
             Xlib.ext.xtest.fake_input(dm, Xlib.X.MotionNotify, x=px, y=py)
 
     def _scroll(self, dx, dy):
-        dx, dy = self._check_bounds(dx, dy)
-        if dy:
-            self.click(
-                button=Button.scroll_up if dy > 0 else Button.scroll_down,
-                count=abs(dy))
-
-        if dx:
-            self.click(
-                button=Button.scroll_right if dx > 0 else Button.scroll_left,
-                count=abs(dx))
+        self._scroll_many(((dx, dy),))
+
+    def _scroll_many(self, deltas):
+        # Validate all vectors before sending anything
+        clicks = []
+        for dx, dy in deltas:
+            dx, dy = self._check_bounds(dx, dy)
+            if dy:
+                clicks.append((
+                    Button.scroll_up if dy > 0 else Button.scroll_down,
+                    abs(dy)))
+            if dx:
+                clicks.append((
+                    Button.scroll_right if dx > 0 else Button.scroll_left,
+                    abs(dx)))
+
+        # Send all button clicks with a single sync of the display
+        with display_manager(self._display) as dm:
+            for button, count in clicks:
+                for _ in range(count):
+                    Xlib.ext.xtest.fake_input(
+                        dm, Xlib.X.ButtonPress, button.value)
+                    Xlib.ext.xtest.fake_input(
+                        dm, Xlib.X.ButtonRelease, button.value)
 
     def _press(self, button):
         with display_manager(self._display) as dm:
@@ -127,12 +141,20 @@ class Listener(ListenerMixin, _base.Listener):
         Button.scroll_right.value: (1, 0),
         Button.scroll_left.value: (-1, 0)}
 
+    #: A mapping from button values to buttons
+    _BUTTONS = {
+        button.value: button
+        for button in Button
+        if button.value is not None}
+
     _EVENTS = (
         Xlib.X.ButtonPressMask,
         Xlib.X.ButtonReleaseMask)
 
     def __init__(self, *args, **kwargs):
         super(Listener, self).__init__(*args, **kwargs)
+        if self._options.get('merge_moves', False):
+            self._coalesced_events = frozenset((Xlib.X.MotionNotify,))
 
     def _handle(self, dummy_display, event):
         px = event.root_x
@@ -164,7 +186,6 @@ class Listener(ListenerMixin, _base.Listener):
     def _suppress_stop(self, display):
         display.ungrab_pointer(Xlib.X.CurrentTime)
 
-    # pylint: disable=R0201
     def _button(self, detail):
         """Creates a mouse button from an event detail.
 
@@ -174,8 +195,4 @@ class Listener(ListenerMixin, _base.Listener):
 
         :return: a button
         """
-        try:
-            return Button(detail)
-        except ValueError:
-            return Button.unknown
-    # pylint: enable=R0201
+        return self._BUTTONS.get(detail, Button.unknown)
@@ -186,3 +186,32 @@ class MouseControllerTest(EventTest):
                 'Failed to send scroll down event',
                 on_scroll=lambda x, y, dx, dy: dy < 0):
             self.controller.scroll(0, -1)
+
+    def test_scroll_many(self):
+        """Tests that scroll_many sends the same events as repeated calls to
+        scroll"""
+        deltas = [(0, 1), (0, -1), (0, 2), (0, -2)]
+
+        def scroll_events(send):
+            events = []
+            with self.listener(
+                    on_scroll=lambda x, y, dx, dy: events.append((dx, dy))):
+                time.sleep(0.1)
+                send()
+                time.sleep(1)
+            return events
+
+        def scroll():
+            for dx, dy in deltas:
+                self.controller.scroll(dx, dy)
+
+        expected = scroll_events(scroll)
+        actual = scroll_events(lambda: self.controller.scroll_many(deltas))
+
+        self.assertTrue(
+            expected,
+            'Failed to send scroll events')
+        self.assertEqual(
+            expected,
+            actual,
+            'scroll_many sent different events than scroll')
@@ -169,6 +169,44 @@ class MouseListenerTest(EventTest):
                 win32_test=False,
                 xorg_test=True)._options['test'])
 
+    def test_event_eq(self):
+        """Tests that events compare equal only to events of the same type
+        with equal fields"""
+        from pynput.mouse import Events
+
+        class Point(Events.Event):
+            __slots__ = ('x', 'y')
+
+            def __init__(self, x, y):
+                self.x = x
+                self.y = y
+
+        class Tagged(Point):
+            def __init__(self, x, y, tag):
+                super(Tagged, self).__init__(x, y)
+                self.tag = tag
+
+        self.assertEqual(Events.Move(1, 2), Events.Move(1, 2))
+        self.assertNotEqual(Events.Move(1, 2), Events.Move(1, 3))
+        self.assertNotEqual(Events.Move(1, 2), Point(1, 2))
+        self.assertNotEqual(Events.Move(1, 2), Events.Scroll(1, 2, 0, 0))
+        self.assertEqual(Tagged(1, 2, 'a'), Tagged(1, 2, 'a'))
+        self.assertNotEqual(Tagged(1, 2, 'a'), Tagged(1, 3, 'a'))
+        self.assertNotEqual(Tagged(1, 2, 'a'), Tagged(1, 2, 'b'))
+        self.assertEqual('Tagged(x=1, y=2, tag=a)', str(Tagged(1, 2, 'a')))
+
+    def test_event_str(self):
+        """Tests that events are converted to strings listing their fields in
+        order"""
+        from pynput.mouse import Events
+
+        self.assertEqual(
+            'Move(x=1, y=2)',
+            str(Events.Move(1, 2)))
+        self.assertEqual(
+            'Scroll(x=1, y=2, dx=3, dy=4)',
+            str(Events.Scroll(1, 2, 3, 4)))
+
     def test_events(self):
         """Tests that events are correctly yielded"""
         from pynput.mouse import Button, Events